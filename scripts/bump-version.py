@@ -8,13 +8,20 @@ import re
 import subprocess
 import json
 import argparse
+import functools
 import plistlib
 from datetime import datetime
-from typing import Optional, Tuple, List
+from typing import IO, Iterator, Optional, Tuple
 from pathlib import Path
 from enum import Enum
 
 
+# Semantic version and conventional commit patterns
+_SEMVER_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9.-]+))?$')
+_CONV_TYPE_RE = re.compile(r'^(?P<type>[a-zA-Z]+)(?:\([^)]*\))?(?P<bang>!)?:')
+_BREAKING_RE = re.compile(r'BREAKING[ -]CHANGE', re.IGNORECASE)
+
+
 class BumpType(Enum):
     """Types of version bumps according to semantic versioning."""
     MAJOR = "major"
@@ -23,12 +30,36 @@ class BumpType(Enum):
     NONE = "none"
 
 
+# Bump triggered by each conventional commit type; anything else is a patch
+_TYPE_BUMPS = {
+    'feat': BumpType.MINOR,
+    'fix': BumpType.PATCH,
+    'perf': BumpType.PATCH,
+    'docs': BumpType.PATCH,
+    'style': BumpType.PATCH,
+    'refactor': BumpType.PATCH,
+    'test': BumpType.PATCH,
+    'chore': BumpType.PATCH,
+    'ci': BumpType.PATCH,
+    'build': BumpType.PATCH,
+}
+
+_PRIORITY = {
+    BumpType.NONE: 0,
+    BumpType.PATCH: 1,
+    BumpType.MINOR: 2,
+    BumpType.MAJOR: 3,
+}
+
+
 class SemanticVersion:
     """Simple semantic version handling."""
     
+    __slots__ = ('original', 'major', 'minor', 'patch', 'prerelease')
+    
     def __init__(self, version_string: str):
         self.original = version_string
-        match = re.match(r'^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9.-]+))?$', version_string)
+        match = _SEMVER_RE.match(version_string)
         if not match:
             raise ValueError(f"Invalid semantic version: {version_string}")
         
@@ -46,100 +77,113 @@ class SemanticVersion:
         elif bump_type == BumpType.PATCH:
             return SemanticVersion(f"{self.major}.{self.minor}.{self.patch + 1}")
         else:  # NONE
-            return SemanticVersion(str(self))
+            return self
     
     def __str__(self) -> str:
         base = f"{self.major}.{self.minor}.{self.patch}"
         return f"{base}-{self.prerelease}" if self.prerelease else base
     
+    def _key(self) -> Tuple[int, int, int, Optional[str]]:
+        return (self.major, self.minor, self.patch, self.prerelease)
+    
     def __eq__(self, other) -> bool:
         if not isinstance(other, SemanticVersion):
             return False
-        return str(self) == str(other)
+        return self._key() == other._key()
+    
+    def __hash__(self) -> int:
+        return hash(self._key())
 
 
 class CommitAnalyzer:
     """Analyzes conventional commits to determine version bump needed."""
     
+    __slots__ = ('from_ref', 'to_ref', 'commit_count', 'stopped_at_breaking_change')
+    
     def __init__(self, from_ref: str, to_ref: str = 'HEAD'):
         self.from_ref = from_ref
         self.to_ref = to_ref
+        self.commit_count = 0
+        self.stopped_at_breaking_change = False
     
-    def get_commits(self) -> List[str]:
-        """Get commit messages between references."""
+    def get_commits(self) -> Iterator[str]:
+        """Stream commit messages between references as git produces them."""
+        cmd = ['git', 'log', f'{self.from_ref}..{self.to_ref}', '--pretty=tformat:%s', '-z']
         try:
-            cmd = ['git', 'log', f'{self.from_ref}..{self.to_ref}', '--pretty=format:%s']
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
+                for message in read_nul_records(proc.stdout):
+                    if message:
+                        yield message
+                if proc.wait() != 0:
+                    raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=proc.stderr.read())
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to get git commits: {e}")
     
     def analyze_commit_message(self, message: str) -> BumpType:
         """Analyze single commit message to determine bump type."""
+        match = _CONV_TYPE_RE.match(message)
+        
         # Check for breaking changes first (highest priority)
-        if ('BREAKING CHANGE' in message.upper() or 
-            'BREAKING-CHANGE' in message.upper() or
-            re.match(r'^[a-zA-Z]+(\([^)]*\))?!:', message)):
+        if (match and match.group('bang')) or _BREAKING_RE.search(message):
             return BumpType.MAJOR
         
-        # Check conventional commit types
-        match = re.match(r'^([a-zA-Z]+)(\([^)]*\))?:', message)
-        if match:
-            commit_type = match.group(1).lower()
-            
-            # Features trigger minor bumps
-            if commit_type == 'feat':
-                return BumpType.MINOR
-            
-            # Bug fixes and other changes trigger patch bumps
-            if commit_type in ['fix', 'perf', 'docs', 'style', 'refactor', 'test', 'chore', 'ci', 'build']:
-                return BumpType.PATCH
-        
         # Non-conventional commits are treated as patch changes
-        return BumpType.PATCH
+        if not match:
+            return BumpType.PATCH
+        
+        return _TYPE_BUMPS.get(match.group('type').lower(), BumpType.PATCH)
     
     def determine_bump_type(self) -> BumpType:
-        """Analyze all commits and determine overall bump type needed."""
-        commits = self.get_commits()
-        if not commits:
-            return BumpType.NONE
-        
+        """Analyze commits, recording how many were examined, and determine the bump type."""
         max_bump = BumpType.NONE
+        commit_count = 0
+        self.stopped_at_breaking_change = False
         
-        for commit in commits:
+        for commit_count, commit in enumerate(self.get_commits(), 1):
             bump = self.analyze_commit_message(commit)
             
             # Take the highest bump level needed
-            if bump == BumpType.MAJOR:
-                max_bump = BumpType.MAJOR
-            elif bump == BumpType.MINOR and max_bump != BumpType.MAJOR:
-                max_bump = BumpType.MINOR
-            elif bump == BumpType.PATCH and max_bump == BumpType.NONE:
-                max_bump = BumpType.PATCH
+            if _PRIORITY[bump] > _PRIORITY[max_bump]:
+                max_bump = bump
+            
+            # Nothing outranks a major bump, so stop reading git output
+            if max_bump == BumpType.MAJOR:
+                self.stopped_at_breaking_change = True
+                break
         
+        self.commit_count = commit_count
         return max_bump
 
 
 class VersionManager:
     """Manages version updates in project files."""
     
+    __slots__ = ('info_plist_path', '_plist_cache')
+    
     def __init__(self, info_plist_path: str = "Sources/WorkoutTracker/Info.plist"):
         self.info_plist_path = Path(info_plist_path)
+        self._plist_cache: Optional[dict] = None
+    
+    def _load_plist(self) -> dict:
+        """Parse Info.plist once and reuse it for both reading and updating."""
+        if self._plist_cache is None:
+            with open(self.info_plist_path, 'rb') as f:
+                self._plist_cache = plistlib.load(f)
+        return self._plist_cache
     
     def get_current_version(self) -> SemanticVersion:
         """Get current version from Info.plist or git tags."""
         # Try Info.plist first
         if self.info_plist_path.exists():
             try:
-                with open(self.info_plist_path, 'rb') as f:
-                    plist = plistlib.load(f)
-                
-                version_string = plist.get('CFBundleShortVersionString', '0.0.0')
+                version_string = self._load_plist().get('CFBundleShortVersionString', '0.0.0')
                 
                 # Ensure it's a valid semantic version
-                if not re.match(r'^\d+\.\d+\.\d+', version_string):
+                parts = version_string.split('.')
+                has_semver_prefix = (len(parts) >= 3 and parts[0].isdecimal() and
+                                     parts[1].isdecimal() and parts[2][:1].isdecimal())
+                if not has_semver_prefix:
                     # Convert simple versions like "1.0" to "1.0.0"
-                    parts = version_string.split('.')
                     while len(parts) < 3:
                         parts.append('0')
                     version_string = '.'.join(parts[:3])
@@ -149,16 +193,13 @@ class VersionManager:
                 print(f"Warning: Could not read version from Info.plist: {e}")
         
         # Fallback to git tags
-        try:
-            result = subprocess.run(['git', 'describe', '--tags', '--abbrev=0'], 
-                                  capture_output=True, text=True, check=True)
-            tag = result.stdout.strip()
-            # Remove 'v' prefix if present
-            version_string = tag[1:] if tag.startswith('v') else tag
-            return SemanticVersion(version_string)
-        except subprocess.CalledProcessError:
+        tag = get_last_version_tag()
+        if not tag:
             # No tags exist, start from 0.0.0
             return SemanticVersion("0.0.0")
+        # Remove 'v' prefix if present
+        version_string = tag[1:] if tag.startswith('v') else tag
+        return SemanticVersion(version_string)
     
     def update_info_plist(self, new_version: SemanticVersion) -> bool:
         """Update version in Info.plist file."""
@@ -167,20 +208,18 @@ class VersionManager:
             return False
         
         try:
-            with open(self.info_plist_path, 'rb') as f:
-                plist = plistlib.load(f)
+            plist = self._load_plist()
+            if plist.get('CFBundleShortVersionString') == str(new_version):
+                # Already at this version; nothing to write
+                return True
             
             # Update version
             plist['CFBundleShortVersionString'] = str(new_version)
             
-            # Optionally increment build number
-            current_build = plist.get('CFBundleVersion', '1')
-            try:
-                new_build = str(int(current_build) + 1)
-                plist['CFBundleVersion'] = new_build
-            except ValueError:
-                # Keep existing build number if it's not numeric
-                pass
+            # Optionally increment build number; keep it as-is if it's not numeric
+            current_build = str(plist.get('CFBundleVersion', '1'))
+            if current_build.isdecimal():
+                plist['CFBundleVersion'] = str(int(current_build) + 1)
             
             with open(self.info_plist_path, 'wb') as f:
                 plistlib.dump(plist, f)
@@ -191,6 +230,17 @@ class VersionManager:
             return False
 
 
+def read_nul_records(stream: IO[str]) -> Iterator[str]:
+    """Yield NUL-delimited records from a text stream as they arrive."""
+    pending = ''
+    for chunk in iter(lambda: stream.read(65536), ''):
+        *records, pending = (pending + chunk).split('\0')
+        yield from records
+    if pending:
+        yield pending
+
+
+@functools.lru_cache(maxsize=1)
 def get_last_version_tag() -> Optional[str]:
     """Get the last version tag from git."""
     try:
@@ -201,6 +251,7 @@ def get_last_version_tag() -> Optional[str]:
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_first_commit() -> Optional[str]:
     """Get the first commit hash."""
     try:
@@ -250,8 +301,9 @@ def main():
             'bump_type': bump_type.value,
             'from_ref': from_ref,
             'to_ref': args.to_ref,
-            'commits_analyzed': len(analyzer.get_commits()),
-            'version_changed': str(current_version) != str(new_version),
+            'commits_analyzed': analyzer.commit_count,
+            'stopped_at_breaking_change': analyzer.stopped_at_breaking_change,
+            'version_changed': current_version != new_version,
             'generated_at': datetime.now().isoformat()
         }
         
@@ -259,7 +311,8 @@ def main():
         print(f"📊 Version Analysis Results")
         print(f"==========================")
         print(f"Current Version: {current_version}")
-        print(f"Commits Analyzed: {result['commits_analyzed']} (from {from_ref} to {args.to_ref})")
+        scan_note = "; stopped at first breaking change" if analyzer.stopped_at_breaking_change else ""
+        print(f"Commits Analyzed: {result['commits_analyzed']} (from {from_ref} to {args.to_ref}{scan_note})")
         print(f"Bump Type: {bump_type.value}")
         print(f"New Version: {new_version}")
         
@@ -283,7 +336,8 @@ def main():
         if args.output_json:
             output_path = Path(args.output_json)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(json.dumps(result, indent=2))
+            with open(output_path, 'w', buffering=65536) as f:
+                json.dump(result, f, indent=2)
             print(f"📄 Version info saved to {args.output_json}")
         
         return 0
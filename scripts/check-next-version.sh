@@ -22,7 +22,8 @@ print(f\"📊 Version Analysis:\")
 print(f\"  Current Version: {data['current_version']}\")
 print(f\"  Next Version: {data['new_version']}\")
 print(f\"  Bump Type: {data['bump_type']}\")
-print(f\"  Commits Analyzed: {data['commits_analyzed']}\")
+scan_note = ' (stopped at first breaking change)' if data.get('stopped_at_breaking_change') else ''
+print(f\"  Commits Analyzed: {data['commits_analyzed']}{scan_note}\")
 print(f\"  Version Will Change: {'Yes' if data['version_changed'] else 'No'}\")
 
 if data['version_changed']:
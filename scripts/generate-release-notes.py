@@ -8,56 +8,66 @@ import re
 import subprocess
 import json
 import argparse
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple, Optional
+from typing import IO, Dict, Iterator, List, Tuple, Optional
 from pathlib import Path
 
 
+# A '!' marker on any type is breaking, even if it isn't a known category
+_BANG_RE = re.compile(r'^[a-zA-Z]+(\([^)]*\))?!:')
+
+
 class ReleaseNotesGenerator:
     """Generate release notes from conventional commit messages."""
     
+    __slots__ = ('from_ref', 'to_ref', 'commit_count', 'categorized_commits',
+                 'category_counts', 'breaking_changes', 'present_categories')
+    
+    # Listed in display order, most important first
     CATEGORIES = {
         'feat': '🚀 New Features',
-        'fix': '🐛 Bug Fixes', 
+        'fix': '🐛 Bug Fixes',
+        'perf': '⚡ Performance',
         'docs': '📚 Documentation',
-        'style': '💅 Code Style',
         'refactor': '♻️ Code Refactoring',
         'test': '🧪 Tests',
-        'chore': '🔧 Maintenance',
         'ci': '👷 CI/CD',
-        'perf': '⚡ Performance',
         'build': '📦 Build System',
+        'chore': '🔧 Maintenance',
+        'style': '💅 Code Style',
         'revert': '⏪ Reverts'
     }
     
+    # Pattern: type(scope)!: description, for known types only so that
+    # anything else fails one match and lands in 'other'
+    _CATEGORY_RE = re.compile(r'^(' + '|'.join(CATEGORIES) + r')(\([^)]*\))?(!)?:\s*(.*)$')
+    
     def __init__(self, from_ref: str, to_ref: str = 'HEAD'):
         self.from_ref = from_ref
         self.to_ref = to_ref
-        self.commits = []
-        self.categorized_commits: Dict[str, List[str]] = {}
+        self.commit_count = 0
+        self.categorized_commits: Dict[str, List[str]] = defaultdict(list)
+        self.category_counts: Dict[str, int] = defaultdict(int)
         self.breaking_changes: List[str] = []
+        self.present_categories: List[str] = []
         
-    def get_commits(self) -> List[Tuple[str, str]]:
-        """Get commit messages between references."""
+    def get_commits(self) -> Iterator[Tuple[str, str]]:
+        """Stream (hash, message) pairs between references as git produces them."""
+        cmd = ['git', 'log', f'{self.from_ref}..{self.to_ref}', '--pretty=tformat:%H%x00%s', '-z']
         try:
-            cmd = ['git', 'log', f'{self.from_ref}..{self.to_ref}', '--pretty=format:%H|%s']
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            
-            commits = []
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    hash_msg = line.split('|', 1)
-                    if len(hash_msg) == 2:
-                        commits.append((hash_msg[0], hash_msg[1]))
-            return commits
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
+                records = read_nul_records(proc.stdout)
+                # Hash and subject alternate as separate NUL-delimited fields
+                yield from zip(records, records)
+                if proc.wait() != 0:
+                    raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=proc.stderr.read())
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to get git commits: {e}")
     
     def parse_conventional_commit(self, message: str) -> Tuple[str, str, bool]:
         """Parse conventional commit message format."""
-        # Pattern: type(scope)!: description
-        pattern = r'^([a-zA-Z]+)(\([^)]*\))?(!)?:\s*(.*)$'
-        match = re.match(pattern, message)
+        match = self._CATEGORY_RE.match(message)
         
         if match:
             commit_type = match.group(1)
@@ -71,99 +81,99 @@ class ReleaseNotesGenerator:
             
             return commit_type, formatted, breaking
         
-        # Non-conventional commit
-        return 'other', message, False
+        # Non-conventional commit or unknown type
+        return 'other', message, bool(_BANG_RE.match(message))
     
     def categorize_commits(self) -> None:
         """Categorize commits by type."""
-        self.commits = self.get_commits()
+        # Bound locally since these are hit once per commit
+        parse = self.parse_conventional_commit
+        categorized = self.categorized_commits
+        category_counts = self.category_counts
+        breaking_changes = self.breaking_changes
+        commit_count = 0
         
-        for hash_val, message in self.commits:
-            commit_type, formatted_msg, is_breaking = self.parse_conventional_commit(message)
+        for hash_val, message in self.get_commits():
+            commit_count += 1
+            commit_type, formatted_msg, is_breaking = parse(message)
             
             # Track breaking changes
             if is_breaking or 'BREAKING CHANGE' in message:
-                self.breaking_changes.append(formatted_msg)
+                breaking_changes.append(formatted_msg)
             
             # Categorize commit
-            if commit_type not in self.categorized_commits:
-                self.categorized_commits[commit_type] = []
-            self.categorized_commits[commit_type].append(formatted_msg)
+            categorized[commit_type].append(formatted_msg)
+            category_counts[commit_type] += 1
+        
+        self.commit_count = commit_count
+        self.present_categories = [t for t in self.CATEGORIES if t in categorized]
     
     def generate_markdown(self, version: Optional[str] = None, github_format: bool = False) -> str:
         """Generate markdown release notes."""
         self.categorize_commits()
+        now = datetime.now()
+        categories = self.CATEGORIES
+        categorized = self.categorized_commits
+        breaking_changes = self.breaking_changes
         
         lines = []
         
         # Title
         if not github_format:
-            if version:
-                lines.append(f"# Release Notes - v{version}")
-            else:
-                lines.append(f"# Release Notes - {datetime.now().strftime('%Y-%m-%d')}")
-            lines.append("")
-            lines.append(f"_Generated from commits {self.from_ref}..{self.to_ref}_")
-            lines.append("")
+            title = f"v{version}" if version else now.strftime('%Y-%m-%d')
+            lines.extend([
+                f"# Release Notes - {title}",
+                "",
+                f"_Generated from commits {self.from_ref}..{self.to_ref}_",
+                "",
+            ])
         
         # Summary
-        total_commits = len(self.commits)
-        category_count = len(self.categorized_commits)
+        total_commits = self.commit_count
+        category_count = len(categorized)
         
         if not github_format:
-            lines.append("## Summary")
-            lines.append("")
-            lines.append(f"**{total_commits} commits** across {category_count} categories:")
-            lines.append("")
-            
-            for commit_type in self.CATEGORIES:
-                if commit_type in self.categorized_commits:
-                    count = len(self.categorized_commits[commit_type])
-                    lines.append(f"- {self.CATEGORIES[commit_type]}: {count} commits")
-            
-            if 'other' in self.categorized_commits:
-                count = len(self.categorized_commits['other'])
-                lines.append(f"- 📋 Other Changes: {count} commits")
+            lines.extend([
+                "## Summary",
+                "",
+                f"**{total_commits} commits** across {category_count} categories:",
+                "",
+            ])
+            lines.extend(
+                f"- {categories[commit_type]}: {len(categorized[commit_type])} commits"
+                for commit_type in self.present_categories
+            )
+            if 'other' in categorized:
+                lines.append(f"- 📋 Other Changes: {len(categorized['other'])} commits")
             lines.append("")
         
         # Breaking changes
-        if self.breaking_changes:
-            lines.append("## ⚠️ BREAKING CHANGES")
-            lines.append("")
-            for change in self.breaking_changes:
-                lines.append(f"- {change}")
+        if breaking_changes:
+            lines.extend(["## ⚠️ BREAKING CHANGES", ""])
+            lines.extend(f"- {change}" for change in breaking_changes)
             lines.append("")
         
         # Changes by category
-        lines.append("## Changes")
-        lines.append("")
+        lines.extend(["## Changes", ""])
         
-        # Order categories by importance
-        category_order = ['feat', 'fix', 'perf', 'docs', 'refactor', 'test', 'ci', 'build', 'chore', 'style', 'revert']
-        
-        for commit_type in category_order:
-            if commit_type in self.categorized_commits:
-                category_name = self.CATEGORIES[commit_type]
-                lines.append(f"### {category_name}")
-                lines.append("")
-                
-                for commit_msg in self.categorized_commits[commit_type]:
-                    lines.append(f"- {commit_msg}")
-                lines.append("")
+        for commit_type in self.present_categories:
+            lines.extend([f"### {categories[commit_type]}", ""])
+            lines.extend(f"- {commit_msg}" for commit_msg in categorized[commit_type])
+            lines.append("")
         
         # Other changes
-        if 'other' in self.categorized_commits:
-            lines.append("### 📋 Other Changes")
-            lines.append("")
-            for commit_msg in self.categorized_commits['other']:
-                lines.append(f"- {commit_msg}")
+        if 'other' in categorized:
+            lines.extend(["### 📋 Other Changes", ""])
+            lines.extend(f"- {commit_msg}" for commit_msg in categorized['other'])
             lines.append("")
         
         # Footer
         if not github_format:
-            lines.append("---")
-            lines.append("")
-            lines.append(f"_Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}_")
+            lines.extend([
+                "---",
+                "",
+                f"_Generated on {now.strftime('%Y-%m-%d %H:%M:%S %Z')}_",
+            ])
             if version:
                 lines.append(f"_Version: {version}_")
         
@@ -175,14 +185,24 @@ class ReleaseNotesGenerator:
             'version': version or 'unknown',
             'from_ref': self.from_ref,
             'to_ref': self.to_ref,
-            'total_commits': len(self.commits),
+            'total_commits': self.commit_count,
             'categories': list(self.categorized_commits.keys()),
-            'commit_counts': {k: len(v) for k, v in self.categorized_commits.items()},
+            'commit_counts': dict(self.category_counts),
             'breaking_changes': len(self.breaking_changes),
             'generated_at': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
         }
 
 
+def read_nul_records(stream: IO[str]) -> Iterator[str]:
+    """Yield NUL-delimited records from a text stream as they arrive."""
+    pending = ''
+    for chunk in iter(lambda: stream.read(65536), ''):
+        *records, pending = (pending + chunk).split('\0')
+        yield from records
+    if pending:
+        yield pending
+
+
 def get_last_tag() -> Optional[str]:
     """Get the last git tag, or None if no tags exist."""
     try:
@@ -238,7 +258,8 @@ def main():
         # Write JSON summary
         summary_path = output_path.parent / 'release-summary.json'
         summary = generator.generate_summary_json(args.version)
-        summary_path.write_text(json.dumps(summary, indent=2))
+        with open(summary_path, 'w', buffering=65536) as f:
+            json.dump(summary, f, indent=2)
         
         # Display summary
         print(f"✅ Release notes generated successfully!")